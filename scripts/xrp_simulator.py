@@ -5,24 +5,104 @@ Simulates construction payment workflows using XRPL testnet
 Standalone script for offline testing and demonstration
 
 Requirements:
-    pip install xrpl-py requests
+    pip install xrpl-py aiohttp orjson
 
 Usage:
     python scripts/xrp_simulator.py
 """
 
+import asyncio
+import os
+import sys
 import time
-import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from xrpl.clients import JsonRpcClient
+from decimal import Decimal
+from functools import lru_cache
+import aiohttp
+import orjson
+from xrpl import CryptoAlgorithm
+from xrpl.asyncio.clients import AsyncWebsocketClient
 from xrpl.wallet import Wallet
-from xrpl.models.transactions import Payment, EscrowCreate
+from xrpl.models.requests import AccountInfo, StreamParameter, Subscribe
+from xrpl.models.transactions import Payment, EscrowCreate, Memo
 from xrpl.utils import xrp_to_drops, drops_to_xrp
-from xrpl.transaction import submit_and_wait
-from xrpl.account import get_balance
+from xrpl.asyncio.transaction import (
+    autofill_and_sign,
+    submit,
+    XRPLReliableSubmissionException,
+)
+from xrpl.asyncio.account import get_balance
+from xrpl.asyncio.clients.exceptions import XRPLRequestFailureException
 
 # XRPL Testnet Configuration
 TESTNET_URL = "https://s.altnet.rippletest.net:51234"
+TESTNET_WS_URL = "wss://s.altnet.rippletest.net:51233"
+FAUCET_URL = "https://faucet.altnet.rippletest.net/accounts"
+
+# Ledgers a pipelined transaction may wait before it expires
+LEDGER_OFFSET = 20
+
+# Backstop (seconds) if the ledger stream stalls; transactions normally
+# fail as soon as a ledger past their LastLedgerSequence closes
+TX_VALIDATION_TIMEOUT = 120
+
+# Preliminary results that may still end up in a validated ledger
+_PENDING_RESULT_PREFIXES = ("tes", "tec", "ter")
+
+# Unix timestamp of the Ripple epoch (Jan 1, 2000 UTC)
+_RIPPLE_EPOCH_OFFSET = 946684800
+
+# Saved wallets are reused on later runs instead of hitting the faucet
+WALLET_FILE = "simulation_wallets.json"
+WALLET_ROLES = {
+    "owner": "Owner Wallet",
+    "gc": "General Contractor Wallet",
+    "subcontractor": "Subcontractor Wallet",
+}
+# Balance (XRP) below which a wallet is topped up from the faucet;
+# the owner must cover the 50 XRP escrow + 25 XRP payment plus reserve/fees
+MIN_BALANCE_XRP = {"owner": 80, "gc": 1, "subcontractor": 1}
+
+# Hex-encoded MemoType values (only MemoData varies per transaction)
+_MEMO_TYPE_PAYMENT = "construction-payment".encode().hex()
+_MEMO_TYPE_ESCROW = "construction-escrow".encode().hex()
+
+@lru_cache(maxsize=256)
+def _xrp_drops(amount_xrp):
+    """Memoized xrp_to_drops for amounts that repeat across transactions"""
+    return xrp_to_drops(amount_xrp)
+
+def _make_memo(memo_type_hex, memo):
+    """Build the memos field for a transaction, or None when there is no memo text"""
+    if not memo:
+        return None
+    return [Memo(memo_data=memo.encode('utf-8').hex(), memo_type=memo_type_hex)]
+
+class Logger:
+    """
+    Buffers console output and writes it with a single write per flush
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self._lines = []
+
+    def say(self, line=""):
+        """Queue a line for the next flush"""
+        self._lines.append(line)
+
+    def absorb(self, other):
+        """Queue another logger's lines after this one's"""
+        self._lines.extend(other._lines)
+        other._lines.clear()
+
+    def flush(self):
+        """Write all queued lines at once"""
+        if self._lines:
+            self.stream.write("\n".join(self._lines) + "\n")
+            self.stream.flush()
+            self._lines.clear()
 
 class XRPConstructionSimulator:
     """
@@ -30,249 +110,530 @@ class XRPConstructionSimulator:
     """
 
     def __init__(self):
-        self.client = JsonRpcClient(TESTNET_URL)
-        print(f"🔗 Connected to XRPL Testnet: {TESTNET_URL}")
+        self.log = Logger()
+        # Subscription-capable client; opened in open() inside the event loop
+        self.client = AsyncWebsocketClient(TESTNET_WS_URL)
+        self._listener = None
+        self._subscribed: set[str] = set()
+        # tx hash -> (future resolved with its validated stream message,
+        # LastLedgerSequence after which it can no longer validate)
+        self._pending: dict[str, tuple[asyncio.Future, int]] = {}
+        # Shared keep-alive HTTP session for faucet and batch RPC calls,
+        # created on first use inside the running event loop
+        self._session = None
+
+    async def open(self):
+        """Connect the WebSocket client and start dispatching stream events"""
+        await self.client.open()
+        self._listener = asyncio.create_task(self._dispatch_stream())
+        # Ledger closes drive expiry of transactions past their LastLedgerSequence
+        await self.client.request(Subscribe(streams=[StreamParameter.LEDGER]))
+        self.log.say(f"🔗 Connected to XRPL Testnet: {TESTNET_WS_URL}")
+        self.log.flush()
+
+    async def _dispatch_stream(self):
+        """Resolve pending submissions as their validated transactions arrive"""
+        try:
+            async for message in self.client:
+                msg_type = message.get("type")
+                if msg_type == "ledgerClosed":
+                    self._expire_pending(message["ledger_index"])
+                elif msg_type == "transaction" and message.get("validated"):
+                    tx_json = message.get("transaction") or message.get("tx_json") or {}
+                    tx_hash = message.get("hash") or tx_json.get("hash")
+                    waiter, _ = self._pending.pop(tx_hash, (None, None))
+                    if waiter is not None and not waiter.done():
+                        waiter.set_result(message)
+        finally:
+            # Nothing can resolve outstanding submissions once the stream ends
+            for tx_hash, (waiter, _) in list(self._pending.items()):
+                if not waiter.done():
+                    waiter.set_exception(ConnectionError(
+                        f"XRPL stream closed before {tx_hash} validated"
+                    ))
+            self._pending.clear()
+
+    def _expire_pending(self, ledger_index):
+        """Fail submissions whose LastLedgerSequence is behind a closed ledger"""
+        for tx_hash, (waiter, last_ledger) in list(self._pending.items()):
+            if ledger_index > last_ledger:
+                del self._pending[tx_hash]
+                if not waiter.done():
+                    waiter.set_exception(XRPLReliableSubmissionException(
+                        f"Transaction {tx_hash} expired: ledger {last_ledger} closed without it"
+                    ))
+
+    async def _subscribe(self, address):
+        """Subscribe to validated transactions affecting address (once)"""
+        if address not in self._subscribed:
+            await self.client.request(Subscribe(accounts=[address]))
+            self._subscribed.add(address)
+
+    async def _submit_and_wait(self, transaction, wallet):
+        """Sign and submit a transaction, then await its validated stream event"""
+        if self._listener is None or self._listener.done():
+            raise ConnectionError("XRPL stream is not running; call open() first")
+        signed_tx = await autofill_and_sign(transaction, self.client, wallet)
+        tx_hash = signed_tx.get_hash()
+        await self._subscribe(wallet.classic_address)
+
+        # Register before submitting so the validation event cannot be missed
+        waiter = asyncio.get_running_loop().create_future()
+        self._pending[tx_hash] = (waiter, signed_tx.last_ledger_sequence)
+        try:
+            response = await submit(signed_tx, self.client)
+            engine_result = response.result.get("engine_result", "")
+            if not engine_result.startswith(_PENDING_RESULT_PREFIXES):
+                raise XRPLReliableSubmissionException(
+                    f"Transaction failed: {engine_result} {response.result.get('engine_result_message', '')}"
+                )
+            message = await asyncio.wait_for(waiter, TX_VALIDATION_TIMEOUT)
+        finally:
+            self._pending.pop(tx_hash, None)
+            # Cancel an unresolved waiter, or mark a failure set while
+            # submitting as retrieved so asyncio does not warn about it
+            if not waiter.cancel() and not waiter.cancelled():
+                waiter.exception()
+
+        tx_json = message.get("transaction") or message.get("tx_json") or {}
+        return {
+            **tx_json,
+            "hash": tx_hash,
+            "meta": message.get("meta", {}),
+            "validated": message.get("validated", False),
+            "ledger_index": message.get("ledger_index"),
+        }
+
+    def _get_session(self):
+        """Return the shared aiohttp session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=30)
+            )
+        return self._session
+
+    async def aclose(self):
+        """Close the WebSocket client and pooled HTTP connections"""
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+        if self.client.is_open():
+            await self.client.close()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
 
     def create_wallet(self, label="Project Wallet"):
-        """Create a new XRPL wallet"""
-        wallet = Wallet.create()
-        print(f"\n✅ Created {label}")
-        print(f"   Address: {wallet.classic_address}")
-        print(f"   Seed: {wallet.seed}")
-        print(f"   ⚠️  SAVE THIS SEED - IT WILL NOT BE SHOWN AGAIN")
+        """Create a new XRPL wallet (ed25519 keys sign much faster than secp256k1)"""
+        wallet = Wallet.create(algorithm=CryptoAlgorithm.ED25519)
+        # Single say() so lines stay together when wallets are created in threads
+        self.log.say(
+            f"\n✅ Created {label}\n"
+            f"   Address: {wallet.classic_address}\n"
+            f"   Seed: {wallet.seed}\n"
+            f"   ⚠️  SAVE THIS SEED - IT WILL NOT BE SHOWN AGAIN"
+        )
         return wallet
 
-    def fund_wallet(self, wallet):
-        """Fund wallet from testnet faucet"""
-        print(f"\n💰 Funding wallet {wallet.classic_address}...")
+    def load_wallet_pool(self):
+        """Rebuild wallets saved by a previous run, keyed by role"""
+        try:
+            with open(WALLET_FILE, 'rb') as f:
+                wallet_data = orjson.loads(f.read())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return {}
+
+        wallets = {}
+        for role, label in WALLET_ROLES.items():
+            seed = wallet_data.get(role, {}).get("seed")
+            if seed:
+                wallets[role] = Wallet.from_seed(seed)
+                self.log.say(f"\n♻️  Reusing {label}: {wallets[role].classic_address}")
+        return wallets
+
+    def save_wallet_pool(self, wallets):
+        """Persist wallet seeds by role so later runs can reuse them"""
+        wallet_data = {
+            role: {"address": wallet.classic_address, "seed": wallet.seed}
+            for role, wallet in wallets.items()
+        }
+
+        # Write to a temp file and swap it in so a crash never leaves a truncated seed file
+        tmp_path = WALLET_FILE + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(wallet_data, option=orjson.OPT_INDENT_2))
+                # Data must reach disk before the rename, or a power loss can leave an empty file
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, WALLET_FILE)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self.log.say(f"\n💾 Wallet data saved to: {WALLET_FILE}")
+        self.log.say("   ⚠️  KEEP THIS FILE SECURE - Contains wallet seeds!")
+
+    async def fund_wallet(self, wallet, above_drops=0, log=None):
+        """Fund wallet from testnet faucet (above_drops is its balance before funding)"""
+        log = log or self.log
+        log.say(f"\n💰 Funding wallet {wallet.classic_address}...")
 
         # Request testnet XRP from faucet
-        from xrpl.wallet import generate_faucet_wallet
+        # Note: generate_faucet_wallet creates AND funds a wallet
+        # For existing wallet, we'll use the faucet API directly
         try:
-            # Note: generate_faucet_wallet creates AND funds a wallet
-            # For existing wallet, we'll use the faucet API directly
-            import requests
-            response = requests.post(
-                "https://faucet.altnet.rippletest.net/accounts",
+            async with self._get_session().post(
+                FAUCET_URL,
                 json={"destination": wallet.classic_address}
-            )
-
-            if response.status_code == 200:
-                time.sleep(4)  # Wait for ledger update
-                balance = get_balance(wallet.classic_address, self.client)
-                print(f"   ✅ Funded! Balance: {drops_to_xrp(balance)} XRP")
+            ) as response:
+                status = response.status
+
+            if status == 200:
+                balance = await self.wait_for_funded(wallet.classic_address, above_drops)
+                if balance is None:
+                    log.say("   ❌ Faucet funding did not appear on ledger in time")
+                    return False
+                log.say(f"   ✅ Funded! Balance: {drops_to_xrp(balance)} XRP")
                 return True
             else:
-                print(f"   ❌ Faucet request failed: {response.status_code}")
+                log.say(f"   ❌ Faucet request failed: {status}")
                 return False
         except Exception as e:
-            print(f"   ❌ Funding failed: {e}")
+            log.say(f"   ❌ Funding failed: {e}")
             return False
 
-    def get_balance(self, wallet):
+    async def wait_for_funded(self, address, above_drops=0, timeout=20, initial=0.25):
+        """Poll with backoff until the balance exceeds above_drops; returns drops or None on timeout"""
+        delay = initial
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(delay)
+            try:
+                balance = await get_balance(address, self.client)
+                if balance > above_drops:
+                    return balance
+            except XRPLRequestFailureException:
+                pass  # Account not created on ledger yet
+            delay = min(delay * 1.5, 2.0)
+        return None
+
+    async def get_balance(self, wallet, log=None):
         """Get wallet balance"""
-        balance_drops = get_balance(wallet.classic_address, self.client)
+        balance_drops = await get_balance(wallet.classic_address, self.client)
         balance_xrp = drops_to_xrp(balance_drops)
-        print(f"💵 Balance for {wallet.classic_address}: {balance_xrp} XRP")
+        (log or self.log).say(f"💵 Balance for {wallet.classic_address}: {balance_xrp} XRP")
         return balance_xrp
 
-    def send_payment(self, from_wallet, to_address, amount_xrp, memo=""):
-        """Send XRP payment"""
-        print(f"\n📤 Sending {amount_xrp} XRP...")
-        print(f"   From: {from_wallet.classic_address}")
-        print(f"   To: {to_address}")
+    async def batch_balances(self, addrs: list[str]) -> dict[str, Decimal]:
+        """Fetch several balances in one rippled JSON-RPC batch request"""
+        calls = []
+        for addr in addrs:
+            params = AccountInfo(account=addr, ledger_index="validated").to_dict()
+            method = params.pop("method")
+            calls.append({"method": method, "params": [params]})
+
+        replies = None
+        try:
+            session = self._get_session()
+            async with session.post(TESTNET_URL, json={"method": "batch", "params": calls}) as response:
+                if response.status == 200:
+                    replies = await response.json(content_type=None)
+        except (aiohttp.ClientError, ValueError):
+            pass
+
+        # rippled answers a batch with one reply per call, in request order;
+        # anything else means the node or a proxy did not accept the batch
+        if not isinstance(replies, list) or len(replies) != len(addrs):
+            self.log.say("   ⚠️  Batch balance request failed - querying accounts individually")
+            drops = await asyncio.gather(*(self._fetch_balance_drops(addr) for addr in addrs))
+            return self._record_balances(dict(zip(addrs, drops)))
+
+        drops_by_addr = {}
+        for addr, reply in zip(addrs, replies):
+            result = reply.get("result", {}) if isinstance(reply, dict) else {}
+            account_data = result.get("account_data")
+            drops_by_addr[addr] = int(account_data["Balance"]) if account_data else None
+        return self._record_balances(drops_by_addr)
+
+    async def _fetch_balance_drops(self, address):
+        """Fetch one balance in drops, or None if the account does not exist"""
+        try:
+            return await get_balance(address, self.client)
+        except XRPLRequestFailureException:
+            return None
+
+    def _record_balances(self, drops_by_addr):
+        """Convert fetched balances to XRP, logging missing accounts"""
+        balances = {}
+        for addr, balance_drops in drops_by_addr.items():
+            if balance_drops is None:
+                self.log.say(f"   ⚠️  No balance for {addr} (account not found)")
+                continue
+            balances[addr] = drops_to_xrp(str(balance_drops))
+        return balances
+
+    async def get_sequence_window(self, address):
+        """Return (next sequence, last ledger sequence) for pipelining from one account_info call"""
+        response = await self.client.request(AccountInfo(account=address, ledger_index="current"))
+        if not response.is_successful():
+            raise XRPLRequestFailureException(response.result)
+        return (
+            response.result["account_data"]["Sequence"],
+            response.result["ledger_current_index"] + LEDGER_OFFSET,
+        )
 
-        # Build payment transaction
+    async def send_payment(self, from_wallet, to_address, amount_xrp, memo="",
+                           sequence=None, last_ledger_sequence=None, verbose=False, log=None):
+        """Send XRP payment (optionally with a pre-assigned sequence)"""
+        log = log or self.log
+        log.say(f"\n📤 Sending {amount_xrp} XRP...")
+        log.say(f"   From: {from_wallet.classic_address}")
+        log.say(f"   To: {to_address}")
+
+        # Build payment transaction (unset fields are autofilled on submit)
         payment_tx = Payment(
             account=from_wallet.classic_address,
             destination=to_address,
-            amount=xrp_to_drops(amount_xrp),
+            amount=_xrp_drops(amount_xrp),
+            memos=_make_memo(_MEMO_TYPE_PAYMENT, memo),
+            sequence=sequence,
+            last_ledger_sequence=last_ledger_sequence,
         )
 
-        # Add memo if provided
-        if memo:
-            memo_data = memo.encode('utf-8').hex()
-            memo_type = "construction-payment".encode('utf-8').hex()
-            payment_tx.memos = [{
-                "Memo": {
-                    "MemoData": memo_data,
-                    "MemoType": memo_type
-                }
-            }]
-
         # Submit transaction
         try:
-            response = submit_and_wait(payment_tx, self.client, from_wallet)
+            result = await self._submit_and_wait(payment_tx, from_wallet)
 
-            if response.result.get('meta', {}).get('TransactionResult') == 'tesSUCCESS':
-                tx_hash = response.result['hash']
-                print(f"   ✅ Payment successful!")
-                print(f"   Hash: {tx_hash}")
-                print(f"   Validated: {response.result.get('validated', False)}")
+            if result.get('meta', {}).get('TransactionResult') == 'tesSUCCESS':
+                tx_hash = result['hash']
+                log.say(f"   ✅ Payment successful!")
+                log.say(f"   Hash: {tx_hash}")
+                log.say(f"   Validated: {result.get('validated', False)}")
 
-                # Show new balance
-                self.get_balance(from_wallet)
+                # Show new balance (costs an extra RPC round-trip)
+                if verbose:
+                    await self.get_balance(from_wallet, log=log)
                 return tx_hash
             else:
-                print(f"   ❌ Payment failed: {response.result}")
+                log.say(f"   ❌ Payment failed: {result}")
                 return None
         except Exception as e:
-            print(f"   ❌ Payment error: {e}")
+            log.say(f"   ❌ Payment error: {e}")
             return None
 
-    def create_escrow(self, from_wallet, to_address, amount_xrp, days_until_release=7, memo=""):
+    async def create_escrow(self, from_wallet, to_address, amount_xrp, days_until_release=7, memo="",
+                            sequence=None, last_ledger_sequence=None, log=None):
         """Create time-locked escrow for milestone payments"""
-        print(f"\n🔒 Creating escrow for {amount_xrp} XRP...")
-        print(f"   From: {from_wallet.classic_address}")
-        print(f"   To: {to_address}")
-        print(f"   Release after: {days_until_release} days")
-
-        # Calculate timestamps (Ripple epoch: Jan 1, 2000)
-        import time as time_module
-        RIPPLE_EPOCH = 946684800
-        current_time = int(time_module.time())
-        finish_after = current_time + (days_until_release * 24 * 60 * 60) - RIPPLE_EPOCH
-
-        # Build escrow transaction
+        log = log or self.log
+        log.say(f"\n🔒 Creating escrow for {amount_xrp} XRP...")
+        log.say(f"   From: {from_wallet.classic_address}")
+        log.say(f"   To: {to_address}")
+        log.say(f"   Release after: {days_until_release} days")
+
+        # Calculate timestamps (seconds since the Ripple epoch)
+        finish_after = int(time.time() - _RIPPLE_EPOCH_OFFSET) + days_until_release * 86400
+
+        # Build escrow transaction (unset fields are autofilled on submit)
         escrow_tx = EscrowCreate(
             account=from_wallet.classic_address,
             destination=to_address,
-            amount=xrp_to_drops(amount_xrp),
+            amount=_xrp_drops(amount_xrp),
             finish_after=finish_after,
+            memos=_make_memo(_MEMO_TYPE_ESCROW, memo),
+            sequence=sequence,
+            last_ledger_sequence=last_ledger_sequence,
         )
 
-        # Add memo
-        if memo:
-            memo_data = memo.encode('utf-8').hex()
-            memo_type = "construction-escrow".encode('utf-8').hex()
-            escrow_tx.memos = [{
-                "Memo": {
-                    "MemoData": memo_data,
-                    "MemoType": memo_type
-                }
-            }]
-
         # Submit transaction
         try:
-            response = submit_and_wait(escrow_tx, self.client, from_wallet)
+            result = await self._submit_and_wait(escrow_tx, from_wallet)
 
-            if response.result.get('meta', {}).get('TransactionResult') == 'tesSUCCESS':
-                tx_hash = response.result['hash']
-                print(f"   ✅ Escrow created!")
-                print(f"   Hash: {tx_hash}")
-                print(f"   Funds locked until: {datetime.fromtimestamp(finish_after + RIPPLE_EPOCH)}")
+            if result.get('meta', {}).get('TransactionResult') == 'tesSUCCESS':
+                tx_hash = result['hash']
+                log.say(f"   ✅ Escrow created!")
+                log.say(f"   Hash: {tx_hash}")
+                log.say(f"   Funds locked until: {datetime.fromtimestamp(finish_after + _RIPPLE_EPOCH_OFFSET)}")
                 return tx_hash
             else:
-                print(f"   ❌ Escrow creation failed: {response.result}")
+                log.say(f"   ❌ Escrow creation failed: {result}")
                 return None
         except Exception as e:
-            print(f"   ❌ Escrow error: {e}")
+            log.say(f"   ❌ Escrow error: {e}")
             return None
 
-    def simulate_construction_payment_flow(self):
+    async def simulate_construction_payment_flow(self):
         """
         Simulate a complete construction payment workflow:
         1. Owner funds escrow for GC
         2. GC pays subcontractor upon milestone
         """
-        print("\n" + "="*60)
-        print("🏗️  CONSTRUCTION PAYMENT FLOW SIMULATION")
-        print("="*60)
-
-        # Step 1: Create wallets
-        print("\n📋 Step 1: Creating Project Wallets")
-        owner_wallet = self.create_wallet("Owner Wallet")
-        gc_wallet = self.create_wallet("General Contractor Wallet")
-        sub_wallet = self.create_wallet("Subcontractor Wallet")
-
-        # Step 2: Fund owner wallet
-        print("\n📋 Step 2: Funding Owner Wallet from Testnet Faucet")
-        if not self.fund_wallet(owner_wallet):
-            print("❌ Simulation failed - could not fund owner wallet")
+        self.log.say("\n" + "="*60)
+        self.log.say("🏗️  CONSTRUCTION PAYMENT FLOW SIMULATION")
+        self.log.say("="*60)
+
+        # Step 1: Load saved wallets, creating any that are missing
+        self.log.say("\n📋 Step 1: Creating Project Wallets")
+        wallets = self.load_wallet_pool()
+        saved_addresses = [w.classic_address for w in wallets.values()]
+        missing = [role for role in WALLET_ROLES if role not in wallets]
+
+        # A new owner wallet always needs the faucet, so start funding it as
+        # soon as its address exists and create the other wallets meanwhile.
+        # Each funding task logs to its own buffer, reported under Step 2.
+        funding = {}
+        funding_logs = {}
+        if "owner" in missing:
+            missing.remove("owner")
+            wallets["owner"] = self.create_wallet(WALLET_ROLES["owner"])
+            funding_logs["owner"] = Logger()
+            funding["owner"] = asyncio.create_task(
+                self.fund_wallet(wallets["owner"], log=funding_logs["owner"])
+            )
+
+        try:
+            # Generate missing key pairs on worker threads while the saved
+            # wallets' balances are fetched
+            loop = asyncio.get_running_loop()
+            with ThreadPoolExecutor(max_workers=max(len(missing), 1)) as executor:
+                creating = [
+                    loop.run_in_executor(executor, self.create_wallet, WALLET_ROLES[role])
+                    for role in missing
+                ]
+                if saved_addresses:
+                    lookup = self.batch_balances(saved_addresses)
+                else:
+                    lookup = asyncio.sleep(0, result={})
+                balances, *created = await asyncio.gather(lookup, *creating)
+            wallets.update(zip(missing, created))
+
+            # Save seeds before any transactions so a failed run can reuse them
+            self.save_wallet_pool(wallets)
+        except BaseException:
+            # Don't leave the prefetched faucet request running unobserved
+            for task in funding.values():
+                task.cancel()
+            await asyncio.gather(*funding.values(), return_exceptions=True)
+            raise
+        owner_wallet = wallets["owner"]
+        gc_wallet = wallets["gc"]
+        sub_wallet = wallets["subcontractor"]
+        self.log.flush()
+
+        # Step 2: Fund wallets below their required balance concurrently
+        self.log.say("\n📋 Step 2: Funding Project Wallets from Testnet Faucet")
+        for role, wallet in wallets.items():
+            balance_xrp = balances.get(wallet.classic_address, 0)
+            if role not in funding and balance_xrp < MIN_BALANCE_XRP[role]:
+                # A top-up only counts once the balance rises above its current value
+                funding_logs[role] = Logger()
+                funding[role] = asyncio.create_task(self.fund_wallet(
+                    wallet, above_drops=int(xrp_to_drops(balance_xrp)), log=funding_logs[role]
+                ))
+        if not funding:
+            self.log.say("   ✅ Saved wallets already funded - skipping faucet")
+        results = await asyncio.gather(*funding.values())
+        funded = dict(zip(funding, results))
+        for role in funding:
+            self.log.absorb(funding_logs[role])
+        self.log.flush()
+        if not funded.get("owner", True):
+            self.log.say("❌ Simulation failed - could not fund owner wallet")
+            return
+        # The escrow needs the GC account to exist (tecNO_DST otherwise)
+        if not funded.get("gc", True):
+            self.log.say("❌ Simulation failed - could not fund GC wallet")
             return
 
+        # Steps 3 & 4 are both signed by the owner, so pre-assign consecutive
+        # sequence numbers and let them validate in the same ledger close
+        owner_sequence, last_ledger = await self.get_sequence_window(owner_wallet.classic_address)
+
+        # Each concurrent step logs to its own buffer so results stay under their header
+        escrow_log = Logger()
+        payment_log = Logger()
+
         # Step 3: Owner creates escrow for GC (foundation milestone)
-        print("\n📋 Step 3: Owner Creates Escrow for GC (Foundation Milestone)")
+        escrow_log.say("\n📋 Step 3: Owner Creates Escrow for GC (Foundation Milestone)")
         escrow_amount = 50  # 50 XRP (~$100 if 1 XRP = $2)
-        escrow_hash = self.create_escrow(
-            owner_wallet,
-            gc_wallet.classic_address,
-            escrow_amount,
-            days_until_release=7,
-            memo="Project #2025-001: Foundation Complete - $100,000 USD"
-        )
-
-        if not escrow_hash:
-            print("❌ Simulation failed - could not create escrow")
-            return
 
         # Step 4: Owner directly pays GC (immediate payment scenario)
-        print("\n📋 Step 4: Owner Pays GC (Direct Payment - No Escrow)")
+        payment_log.say("\n📋 Step 4: Owner Pays GC (Direct Payment - No Escrow)")
         gc_payment = 25  # 25 XRP
-        gc_payment_hash = self.send_payment(
-            owner_wallet,
-            gc_wallet.classic_address,
-            gc_payment,
-            memo="Project #2025-001: Progress Payment #1"
+
+        escrow_hash, gc_payment_hash = await asyncio.gather(
+            self.create_escrow(
+                owner_wallet,
+                gc_wallet.classic_address,
+                escrow_amount,
+                days_until_release=7,
+                memo="Project #2025-001: Foundation Complete - $100,000 USD",
+                sequence=owner_sequence,
+                last_ledger_sequence=last_ledger,
+                log=escrow_log,
+            ),
+            self.send_payment(
+                owner_wallet,
+                gc_wallet.classic_address,
+                gc_payment,
+                memo="Project #2025-001: Progress Payment #1",
+                sequence=owner_sequence + 1,
+                last_ledger_sequence=last_ledger,
+                log=payment_log,
+            ),
         )
+        self.log.absorb(escrow_log)
+        self.log.absorb(payment_log)
+        self.log.flush()
 
-        time.sleep(2)  # Wait for ledger
+        if not escrow_hash:
+            self.log.say("❌ Simulation failed - could not create escrow")
+            return
 
-        # Step 5: GC pays subcontractor
-        print("\n📋 Step 5: GC Pays Subcontractor")
+        # Step 5: GC pays subcontractor (the gather above has already
+        # awaited validation of the owner's payment to the GC)
+        self.log.say("\n📋 Step 5: GC Pays Subcontractor")
         sub_payment = 10  # 10 XRP
-        sub_payment_hash = self.send_payment(
+        sub_payment_hash = await self.send_payment(
             gc_wallet,
             sub_wallet.classic_address,
             sub_payment,
             memo="Project #2025-001: Concrete Work - Division 03"
         )
+        self.log.flush()
 
         # Final balances
-        print("\n" + "="*60)
-        print("💰 FINAL BALANCES")
-        print("="*60)
-        self.get_balance(owner_wallet)
-        self.get_balance(gc_wallet)
-        self.get_balance(sub_wallet)
+        self.log.say("\n" + "="*60)
+        self.log.say("💰 FINAL BALANCES")
+        self.log.say("="*60)
+        final_balances = await self.batch_balances(
+            [w.classic_address for w in (owner_wallet, gc_wallet, sub_wallet)]
+        )
+        for address, balance_xrp in final_balances.items():
+            self.log.say(f"💵 Balance for {address}: {balance_xrp} XRP")
+        self.log.flush()
 
         # Summary
-        print("\n" + "="*60)
-        print("✅ SIMULATION COMPLETE")
-        print("="*60)
-        print("\n📊 Transaction Summary:")
-        print(f"   Escrow Created: {escrow_hash}")
-        print(f"   GC Payment: {gc_payment_hash}")
-        print(f"   Subcontractor Payment: {sub_payment_hash}")
-        print("\n🔍 View transactions on XRPL Testnet Explorer:")
-        print(f"   https://testnet.xrpl.org/")
-
-        # Save wallet info
-        wallet_data = {
-            "owner": {
-                "address": owner_wallet.classic_address,
-                "seed": owner_wallet.seed
-            },
-            "gc": {
-                "address": gc_wallet.classic_address,
-                "seed": gc_wallet.seed
-            },
-            "subcontractor": {
-                "address": sub_wallet.classic_address,
-                "seed": sub_wallet.seed
-            }
-        }
-
-        with open('simulation_wallets.json', 'w') as f:
-            json.dump(wallet_data, f, indent=2)
-
-        print("\n💾 Wallet data saved to: simulation_wallets.json")
-        print("   ⚠️  KEEP THIS FILE SECURE - Contains wallet seeds!")
-
-def main():
+        self.log.say("\n" + "="*60)
+        self.log.say("✅ SIMULATION COMPLETE")
+        self.log.say("="*60)
+        self.log.say("\n📊 Transaction Summary:")
+        self.log.say(f"   Escrow Created: {escrow_hash}")
+        self.log.say(f"   GC Payment: {gc_payment_hash}")
+        self.log.say(f"   Subcontractor Payment: {sub_payment_hash}")
+        self.log.say("\n🔍 View transactions on XRPL Testnet Explorer:")
+        self.log.say(f"   https://testnet.xrpl.org/")
+        self.log.flush()
+
+async def main():
     """Run simulation"""
     simulator = XRPConstructionSimulator()
-    simulator.simulate_construction_payment_flow()
+    try:
+        await simulator.open()
+        await simulator.simulate_construction_payment_flow()
+    finally:
+        simulator.log.flush()
+        await simulator.aclose()
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())